@@ -1,344 +1,421 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import orjson
+from pydantic import BaseModel, Field, ValidationError, field_validator
+import hashlib
 import logging
-from datetime import datetime, timedelta
-import traceback
 import math
+import os
+from collections import deque
+from datetime import date, datetime, time as dtime, timedelta
+from functools import lru_cache
+import time
+from typing import Optional
+
+import astro_math
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize JSON with orjson (accepts NumPy values as-is)"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app, resources={r"/api/*": {"origins": "*"}})
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Store calculation logs
-calculation_logs = []
+# Recent calculation logs across all requests, served by /api/get-logs
+# (oldest entries are dropped). Responses only carry their own g.calc_logs.
+calculation_logs = deque(maxlen=int(os.getenv('LOG_RING', '1000')))
+
+@app.before_request
+def init_calc_logs():
+    """Start an empty calculation log for each request"""
+    g.calc_logs = []
+    # Step logging is opt-in (?debug=1, or the older ?include_logs=1)
+    g.verbose = request.args.get('debug') == '1' or request.args.get('include_logs') == '1'
 
 def log_calculation(step, data):
     """Log calculation steps"""
+    if not g.get('verbose'):
+        return
     log_entry = {
-        "timestamp": datetime.now().isoformat(),
+        "ts": time.time(),
         "step": step,
         "data": data
     }
+    g.calc_logs.append(log_entry)
     calculation_logs.append(log_entry)
-    logger.info(f"{step}: {data}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s: %s", step, data)
+
+def format_logs(entries):
+    """Render log entries for a response, with ISO timestamps"""
+    return [
+        {
+            "timestamp": datetime.fromtimestamp(entry["ts"]).isoformat(),
+            "step": entry["step"],
+            "data": entry["data"]
+        }
+        for entry in entries
+    ]
 
 # Vedic Astrology Constants
-NAKSHATRAS = [
+NAKSHATRAS = (
     "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira",
     "Ardra", "Punarvasu", "Pushya", "Ashlesha", "Magha",
     "Purva Phalguni", "Uttara Phalguni", "Hasta", "Chitra", "Swati",
     "Vishakha", "Anuradha", "Jyeshta", "Mula", "Purva Ashadha",
     "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha", "Purva Bhadrapada",
     "Uttara Bhadrapada", "Revati"
-]
+)
 
-RASIS = [
+RASIS = (
     "Mesha", "Vrishabha", "Mithuna", "Karka", "Simha",
     "Kanya", "Tula", "Vrischika", "Dhanu", "Makara",
     "Kumbha", "Meena"
-]
+)
 
-RASI_LORDS = [
+RASI_LORDS = (
     "Mangal", "Shukra", "Budha", "Chandra", "Surya",
     "Budha", "Shukra", "Mangal", "Guru", "Shani",
     "Shani", "Guru"
-]
+)
 
-NAKSHATRA_LORDS = [
+NAKSHATRA_LORDS = (
     "Ketu", "Shukra", "Surya", "Chandra", "Mangal",
     "Rahu", "Guru", "Shani", "Budha", "Ketu",
     "Shukra", "Surya", "Chandra", "Mangal", "Rahu",
     "Guru", "Shani", "Budha", "Ketu", "Shukra",
     "Surya", "Chandra", "Mangal", "Rahu", "Guru",
     "Shani", "Budha"
-]
+)
 
-TITHIS = [
+TITHIS = (
     "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami",
     "Shashthi", "Saptami", "Ashtami", "Navami", "Dashami",
     "Ekadashi", "Dwadashi", "Trayodashi", "Chaturdashi", "Purnima/Amavasya"
-]
+)
 
-YOGAS = [
+YOGAS = (
     "Vishkambha", "Priti", "Ayushman", "Saubhagya", "Shobhana",
     "Atiganda", "Sukarma", "Dhriti", "Shula", "Ganda",
     "Vriddhi", "Dhruva", "Vyaghata", "Harshana", "Vajra",
     "Siddhi", "Sadhya", "Shubha", "Shukla", "Brahma",
     "Indra", "Vaidhriti", "Parigha", "Shiva", "Siddha",
     "Sadhaka", "Vimala"
-]
+)
 
-def calculate_julian_day(year, month, day, hour, minute, second):
-    """Calculate Julian Day Number"""
-    if month <= 2:
-        year -= 1
-        month += 12
-    
-    A = year // 100
-    B = 2 - A + (A // 4)
-    
-    JD = int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + B - 1524.5
-    JD += (hour + minute/60 + second/3600) / 24
-    
-    return JD
+try:
+    # Ahead-of-time build from compile_kernels.py, when it has been run
+    import astro_kernels as kernels
+except ImportError:
+    kernels = astro_math.jit_kernels()
 
-def calculate_sun_position(jd):
-    """Calculate Sun's position (simplified)"""
-    T = (jd - 2451545.0) / 36525.0
-    L0 = 280.46646 + 36000.76983 * T + 0.0003032 * T * T
-    M = 357.52911 + 35999.05029 * T - 0.0001536 * T * T
-    
-    M_rad = math.radians(M)
-    C = (1.914602 - 0.004817 * T - 0.000014 * T * T) * math.sin(M_rad)
-    C += (0.019993 - 0.000101 * T) * math.sin(2 * M_rad)
-    C += 0.000029 * math.sin(3 * M_rad)
-    
-    sun_lon = (L0 + C) % 360
-    return sun_lon
-
-def calculate_moon_position(jd):
-    """Calculate Moon's position (simplified)"""
-    T = (jd - 2451545.0) / 36525.0
-    
-    Lp = 218.3164477 + 481267.88123421 * T - 0.0015786 * T * T + T * T * T / 538841 - T * T * T * T / 65194000
-    D = 297.8501921 + 445267.1114034 * T - 0.0018819 * T * T + T * T * T / 545868 - T * T * T * T / 113065000
-    M = 357.52910918 + 35999.0502909 * T - 0.0001536 * T * T + T * T * T / 24490000
-    Mp = 134.9633964 + 477198.8675055 * T + 0.0087414 * T * T + T * T * T / 69699 - T * T * T * T / 14712000
-    F = 93.2720950 + 483202.0175233 * T - 0.0036539 * T * T - T * T * T / 3526000 + T * T * T * T / 863310000
-    
-    A1 = 119.75 + 131.849 * T
-    A2 = 72.56 + 20.186 * T
-    
-    moon_lon = (Lp + 6.28875 * math.sin(math.radians(Mp)) + 1.27402 * math.sin(math.radians(2*D - Mp)) +
-                0.65892 * math.sin(math.radians(2*D)) + 0.21908 * math.sin(math.radians(2*Mp)) +
-                0.14753 * math.sin(math.radians(D)) + 0.14120 * math.sin(math.radians(Mp - D))) % 360
-    
-    return moon_lon
-
-def apply_ayanamsa(longitude, ayanamsa_value=23.638333):
-    """Apply Ayanamsa to convert Sayana to Nirayana"""
-    nirayana = (longitude - ayanamsa_value) % 360
-    return nirayana
+calculate_julian_day = kernels.calculate_julian_day
+calculate_sun_position = kernels.calculate_sun_position
+calculate_moon_position = kernels.calculate_moon_position
+apply_ayanamsa = kernels.apply_ayanamsa
 
 def get_nakshatra(moon_lon):
     """Get Nakshatra from Moon longitude"""
-    nak_index = int(moon_lon / 13.333333)
-    nak_index = min(nak_index, 26)
-    pada = int((moon_lon % 13.333333) / 3.333333) + 1
+    nak_index, pada = kernels.nakshatra_index(moon_lon)
     return NAKSHATRAS[nak_index], nak_index + 1, pada, NAKSHATRA_LORDS[nak_index]
 
 def get_rasi(longitude):
     """Get Rasi from longitude"""
-    rasi_index = int(longitude / 30)
-    rasi_index = min(rasi_index, 11)
+    rasi_index = kernels.rasi_index(longitude)
     return RASIS[rasi_index], rasi_index + 1, RASI_LORDS[rasi_index]
 
 def get_tithi(sun_lon, moon_lon):
     """Get Tithi from Sun and Moon positions"""
-    elongation = (moon_lon - sun_lon) % 360
-    tithi_index = int(elongation / 12)
-    tithi_index = min(tithi_index, 14)
+    raw_index = kernels.tithi_index(sun_lon, moon_lon)
     
-    paksha = "Suklapaksha" if tithi_index < 15 else "Krishnapaksha"
+    paksha = "Suklapaksha" if raw_index < 15 else "Krishnapaksha"
+    tithi_index = raw_index % 15
     
     return TITHIS[tithi_index], tithi_index + 1, paksha
 
 def get_yoga(sun_lon, moon_lon):
     """Get Yoga from Sun and Moon positions"""
-    yoga_sum = (sun_lon + moon_lon) % 360
-    yoga_index = int(yoga_sum / 13.333333)
-    yoga_index = min(yoga_index, 26)
+    yoga_index = kernels.yoga_index(sun_lon, moon_lon)
     return YOGAS[yoga_index], yoga_index + 1
 
+class BirthInput(BaseModel):
+    """Birth details accepted by the chart endpoints"""
+    name: Optional[str] = None
+    sex: Optional[str] = None
+    birth_date: date  # YYYY-MM-DD
+    birth_time: dtime  # HH:MM[:SS], local time without a UTC offset
+    timezone: float = Field(5.5, ge=-14, le=14, allow_inf_nan=False)
+    latitude: float = Field(0.0, ge=-90, le=90, allow_inf_nan=False)
+    longitude: float = Field(0.0, ge=-180, le=180, allow_inf_nan=False)
+    ayanamsa: str = 'Chitra Paksha'
+    
+    @field_validator('birth_date', mode='before')
+    @classmethod
+    def _pad_birth_date(cls, value):
+        # Keep accepting unpadded dates like 1990-6-15, as the old split/int parsing did
+        if isinstance(value, str):
+            parts = value.split('-')
+            if len(parts) == 3 and all(part.isdigit() for part in parts):
+                return f"{int(parts[0]):04d}-{int(parts[1]):02d}-{int(parts[2]):02d}"
+        return value
+    
+    @field_validator('birth_time', mode='before')
+    @classmethod
+    def _pad_birth_time(cls, value):
+        # Likewise for unpadded times like 9:05 or 9:5:3
+        if isinstance(value, str):
+            parts = value.split(':')
+            if len(parts) in (2, 3) and all(part.isdigit() for part in parts):
+                return ':'.join(f"{int(part):02d}" for part in parts)
+        return value
+    
+    @field_validator('birth_time')
+    @classmethod
+    def _naive_birth_time(cls, value):
+        # The offset belongs in `timezone`; silently dropping it would shift the chart
+        if value.tzinfo is not None:
+            raise ValueError("birth_time must not include a UTC offset; use timezone")
+        return value
+
+@lru_cache(maxsize=4096)
+def _compute_chart(year, month, day, hour, minute, second, timezone):
+    """Calculate chart positions for a birth moment (cached)
+    
+    Returns the chart and its (step, data) calculation steps. Nothing is
+    logged here, so the caller can log the steps on cache hits too.
+    """
+    steps = []
+    
+    # Adjust for timezone
+    hour_utc = hour - timezone
+    
+    # Calculate Julian Day
+    jd = calculate_julian_day(year, month, day, hour_utc, minute, second)
+    steps.append(("JULIAN_DAY", {"jd": jd}))
+    
+    # The fastmath and index kernels turn NaN/inf into plausible-looking
+    # positions instead of raising, so reject them before they get there
+    if not math.isfinite(jd):
+        raise ValueError("Birth details give a non-finite Julian Day")
+    
+    # Calculate planetary positions
+    sun_sayana = calculate_sun_position(jd)
+    moon_sayana = calculate_moon_position(jd)
+    
+    steps.append(("SAYANA_POSITIONS", {
+        "sun_sayana": sun_sayana,
+        "moon_sayana": moon_sayana
+    }))
+    
+    # Apply Ayanamsa (Chitra Paksha = 23.638333)
+    ayanamsa_value = 23.638333
+    sun_nirayana = apply_ayanamsa(sun_sayana, ayanamsa_value)
+    moon_nirayana = apply_ayanamsa(moon_sayana, ayanamsa_value)
+    
+    steps.append(("NIRAYANA_POSITIONS", {
+        "sun_nirayana": sun_nirayana,
+        "moon_nirayana": moon_nirayana,
+        "ayanamsa_applied": ayanamsa_value
+    }))
+    
+    # Calculate Nakshatra
+    nak_name, nak_num, pada, nak_lord = get_nakshatra(moon_nirayana)
+    steps.append(("NAKSHATRA", {
+        "name": nak_name,
+        "number": nak_num,
+        "pada": pada,
+        "lord": nak_lord
+    }))
+    
+    # Calculate Rasi
+    rasi_name, rasi_num, rasi_lord = get_rasi(moon_nirayana)
+    steps.append(("RASI", {
+        "name": rasi_name,
+        "number": rasi_num,
+        "lord": rasi_lord
+    }))
+    
+    # Calculate Tithi
+    tithi_name, tithi_num, paksha = get_tithi(sun_nirayana, moon_nirayana)
+    steps.append(("TITHI", {
+        "name": tithi_name,
+        "number": tithi_num,
+        "paksha": paksha
+    }))
+    
+    # Calculate Yoga
+    yoga_name, yoga_num = get_yoga(sun_nirayana, moon_nirayana)
+    steps.append(("YOGA", {
+        "name": yoga_name,
+        "number": yoga_num
+    }))
+    
+    # Calculate Lagna (simplified - using time-based calculation)
+    lagna_lon = (sun_nirayana + (hour * 15)) % 360
+    lagna_name, lagna_num, lagna_lord = get_rasi(lagna_lon)
+    steps.append(("LAGNA", {
+        "name": lagna_name,
+        "number": lagna_num,
+        "lord": lagna_lord,
+        "longitude": lagna_lon
+    }))
+    
+    chart = {
+        "tithi": {
+            "name": tithi_name,
+            "number": tithi_num,
+            "paksha": paksha
+        },
+        
+        "lagna": {
+            "sign": lagna_name,
+            "lord": lagna_lord,
+            "degrees": lagna_lon
+        },
+        
+        "rasi": {
+            "sign": rasi_name,
+            "lord": rasi_lord
+        },
+        
+        "nakshatra": {
+            "name": nak_name,
+            "number": nak_num,
+            "lord": nak_lord,
+            "pada": pada
+        },
+        
+        "yoga": {
+            "name": yoga_name,
+            "number": yoga_num
+        },
+        
+        "planets": {
+            "sun": {"longitude": sun_nirayana, "sign": get_rasi(sun_nirayana)[0]},
+            "moon": {"longitude": moon_nirayana, "sign": get_rasi(moon_nirayana)[0]}
+        }
+    }
+    
+    return chart, tuple(steps)
+
+# Part of the chart ETag. Bump it whenever astro_math or the chart response
+# shape changes, so clients and CDNs holding old ETags stop getting 304s.
+CHART_VERSION = 1
+
+def set_chart_cache_headers(resp, etag):
+    """Mark a chart response (200 or 304) as cacheable under its ETag"""
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'public, max-age=86400'
+    return resp
+
 @app.route('/api/health', methods=['GET'])
 def health():
     """Health check endpoint"""
     return jsonify({"status": "Backend is running"}), 200
 
-@app.route('/api/calculate-birth-chart', methods=['POST'])
+@app.route('/api/calculate-birth-chart', methods=['GET', 'POST'])
 def calculate_birth_chart():
     """Calculate complete birth chart"""
     try:
-        data = request.json
+        # GET takes the birth details as query parameters and is HTTP-cacheable;
+        # POST takes them as a JSON body and is never cached
+        if request.method == 'GET':
+            inp = BirthInput.model_validate(request.args.to_dict())
+        else:
+            inp = BirthInput.model_validate_json(request.get_data())
+        birth_input = inp.model_dump(mode='json')
         
         # Log input
-        log_calculation("INPUT", {
-            "name": data.get('name'),
-            "sex": data.get('sex'),
-            "birth_date": data.get('birth_date'),
-            "birth_time": data.get('birth_time'),
-            "timezone": data.get('timezone'),
-            "latitude": data.get('latitude'),
-            "longitude": data.get('longitude'),
-            "ayanamsa": data.get('ayanamsa', 'Chitra Paksha')
-        })
-        
-        # Parse birth details
-        birth_date = data.get('birth_date')  # Format: YYYY-MM-DD
-        birth_time = data.get('birth_time')  # Format: HH:MM:SS
-        timezone = float(data.get('timezone', 5.5))
-        latitude = float(data.get('latitude', 0))
-        longitude = float(data.get('longitude', 0))
-        
-        # Parse date and time
-        date_parts = birth_date.split('-')
-        time_parts = birth_time.split(':')
-        
-        year = int(date_parts[0])
-        month = int(date_parts[1])
-        day = int(date_parts[2])
-        hour = int(time_parts[0])
-        minute = int(time_parts[1])
-        second = int(time_parts[2]) if len(time_parts) > 2 else 0
-        
-        # Adjust for timezone
-        hour_utc = hour - timezone
-        
-        # Calculate Julian Day
-        jd = calculate_julian_day(year, month, day, hour_utc, minute, second)
-        log_calculation("JULIAN_DAY", {"jd": jd})
-        
-        # Calculate planetary positions
-        sun_sayana = calculate_sun_position(jd)
-        moon_sayana = calculate_moon_position(jd)
+        log_calculation("INPUT", birth_input)
         
-        log_calculation("SAYANA_POSITIONS", {
-            "sun_sayana": sun_sayana,
-            "moon_sayana": moon_sayana
-        })
+        # Charts are deterministic, so the parsed input identifies the response.
+        # Verbose responses carry per-request logs, so they are never cached.
+        cacheable = request.method == 'GET' and not g.verbose
+        if cacheable:
+            etag = hashlib.blake2b(
+                orjson.dumps({"version": CHART_VERSION, "input": birth_input}, option=orjson.OPT_SORT_KEYS),
+                digest_size=16
+            ).hexdigest()
+            # If-None-Match uses weak comparison (RFC 9110), e.g. behind compressing CDNs
+            if request.if_none_match.contains_weak(etag):
+                return set_chart_cache_headers(app.response_class(status=304), etag)
         
-        # Apply Ayanamsa (Chitra Paksha = 23.638333)
-        ayanamsa_value = 23.638333
-        sun_nirayana = apply_ayanamsa(sun_sayana, ayanamsa_value)
-        moon_nirayana = apply_ayanamsa(moon_sayana, ayanamsa_value)
+        # Round the timezone so equivalent inputs share a cache entry
+        chart, steps = _compute_chart(
+            inp.birth_date.year, inp.birth_date.month, inp.birth_date.day,
+            inp.birth_time.hour, inp.birth_time.minute, inp.birth_time.second,
+            round(inp.timezone, 2)
+        )
+        for step, step_data in steps:
+            log_calculation(step, step_data)
         
-        log_calculation("NIRAYANA_POSITIONS", {
-            "sun_nirayana": sun_nirayana,
-            "moon_nirayana": moon_nirayana,
-            "ayanamsa_applied": ayanamsa_value
-        })
+        result = dict(birth_input)
+        # Chitra Paksha is the only ayanamsa applied so far
+        result["ayanamsa"] = "Chitra Paksha"
+        # The cached chart is shared between requests, so never mutate it
+        result.update(chart)
         
-        # Calculate Nakshatra
-        nak_name, nak_num, pada, nak_lord = get_nakshatra(moon_nirayana)
-        log_calculation("NAKSHATRA", {
-            "name": nak_name,
-            "number": nak_num,
-            "pada": pada,
-            "lord": nak_lord
-        })
-        
-        # Calculate Rasi
-        rasi_name, rasi_num, rasi_lord = get_rasi(moon_nirayana)
-        log_calculation("RASI", {
-            "name": rasi_name,
-            "number": rasi_num,
-            "lord": rasi_lord
-        })
-        
-        # Calculate Tithi
-        tithi_name, tithi_num, paksha = get_tithi(sun_nirayana, moon_nirayana)
-        log_calculation("TITHI", {
-            "name": tithi_name,
-            "number": tithi_num,
-            "paksha": paksha
-        })
-        
-        # Calculate Yoga
-        yoga_name, yoga_num = get_yoga(sun_nirayana, moon_nirayana)
-        log_calculation("YOGA", {
-            "name": yoga_name,
-            "number": yoga_num
-        })
-        
-        # Calculate Lagna (simplified - using time-based calculation)
-        lagna_lon = (sun_nirayana + (hour * 15)) % 360
-        lagna_name, lagna_num, lagna_lord = get_rasi(lagna_lon)
-        log_calculation("LAGNA", {
-            "name": lagna_name,
-            "number": lagna_num,
-            "lord": lagna_lord,
-            "longitude": lagna_lon
-        })
+        log_calculation("BIRTH_CHART_CALCULATED", {"status": "Complete"})
         
-        result = {
-            "name": data.get('name'),
-            "sex": data.get('sex'),
-            "birth_date": birth_date,
-            "birth_time": birth_time,
-            "timezone": timezone,
-            "latitude": latitude,
-            "longitude": longitude,
-            "ayanamsa": "Chitra Paksha",
-            
-            "tithi": {
-                "name": tithi_name,
-                "number": tithi_num,
-                "paksha": paksha
-            },
-            
-            "lagna": {
-                "sign": lagna_name,
-                "lord": lagna_lord,
-                "degrees": lagna_lon
-            },
-            
-            "rasi": {
-                "sign": rasi_name,
-                "lord": rasi_lord
-            },
-            
-            "nakshatra": {
-                "name": nak_name,
-                "number": nak_num,
-                "lord": nak_lord,
-                "pada": pada
-            },
-            
-            "yoga": {
-                "name": yoga_name,
-                "number": yoga_num
-            },
-            
-            "planets": {
-                "sun": {"longitude": sun_nirayana, "sign": get_rasi(sun_nirayana)[0]},
-                "moon": {"longitude": moon_nirayana, "sign": get_rasi(moon_nirayana)[0]}
-            }
+        response = {
+            "success": True,
+            "data": result
         }
+        if g.verbose:
+            response["logs"] = format_logs(g.calc_logs)
         
-        log_calculation("BIRTH_CHART_CALCULATED", {"status": "Complete"})
+        resp = jsonify(response)
+        if cacheable:
+            set_chart_cache_headers(resp, etag)
+        return resp, 200
         
-        return jsonify({
-            "success": True,
-            "data": result,
-            "logs": calculation_logs
-        }), 200
+    except ValidationError as e:
+        errors = e.errors(include_url=False, include_context=False, include_input=False)
+        log_calculation("ERROR", errors)
+        response = {
+            "success": False,
+            "error": "Invalid birth details",
+            "details": errors
+        }
+        if g.verbose:
+            response["logs"] = format_logs(g.calc_logs)
+        return jsonify(response), 400
         
     except Exception as e:
-        error_msg = f"Error calculating birth chart: {str(e)}\n{traceback.format_exc()}"
-        log_calculation("ERROR", error_msg)
-        logger.error(error_msg)
-        return jsonify({
+        logger.exception("Error calculating birth chart")
+        log_calculation("ERROR", str(e))
+        response = {
             "success": False,
-            "error": str(e),
-            "logs": calculation_logs
-        }), 400
+            "error": str(e)
+        }
+        if g.verbose:
+            response["logs"] = format_logs(g.calc_logs)
+        return jsonify(response), 400
 
 @app.route('/api/get-logs', methods=['GET'])
 def get_logs():
     """Get all calculation logs"""
     return jsonify({
-        "logs": calculation_logs
+        "logs": format_logs(list(calculation_logs))
     }), 200
 
 @app.route('/api/clear-logs', methods=['POST'])
 def clear_logs():
     """Clear calculation logs"""
-    global calculation_logs
-    calculation_logs = []
+    calculation_logs.clear()
     return jsonify({"status": "Logs cleared"}), 200
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Local development only; production runs under Gunicorn (see Procfile)
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1', host='0.0.0.0', port=int(os.getenv('PORT', 5000)))
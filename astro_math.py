@@ -0,0 +1,130 @@
+"""Astronomical math kernels for the chart calculations.
+
+These are plain Python functions so they can be compiled either ahead of
+time into the astro_kernels extension (see compile_kernels.py) or, when
+that build is missing, just in time with Numba (see jit_kernels).
+"""
+import math
+from types import SimpleNamespace
+
+SECONDS_TO_DAYS = 1.0 / 86400.0
+
+def calculate_julian_day(year, month, day, hour, minute, second):
+    """Calculate Julian Day Number"""
+    # January and February count as months 13 and 14 of the previous year
+    a = (14 - month) // 12
+    y = year - a
+    m = month + 12 * a
+    
+    A = y // 100
+    
+    JD = (1461 * (y + 4716)) // 4 + (153 * (m + 1)) // 5 + day + 2 - A + A // 4 - 1524.5
+    JD += (hour * 3600 + minute * 60 + second) * SECONDS_TO_DAYS
+    
+    return JD
+
+# Sun's mean anomaly polynomial, pre-scaled to radians
+_DEG2RAD = math.pi / 180.0
+SUN_M_C0 = 357.52911 * _DEG2RAD
+SUN_M_C1 = 35999.05029 * _DEG2RAD
+SUN_M_C2 = -0.0001536 * _DEG2RAD
+
+def calculate_sun_position(jd):
+    """Calculate Sun's position (simplified)"""
+    T = (jd - 2451545.0) / 36525.0
+    L0 = 280.46646 + 36000.76983 * T + 0.0003032 * T * T
+    M = SUN_M_C0 + SUN_M_C1 * T + SUN_M_C2 * T * T
+    
+    C = (1.914602 - 0.004817 * T - 0.000014 * T * T) * math.sin(M)
+    C += (0.019993 - 0.000101 * T) * math.sin(2 * M)
+    C += 0.000029 * math.sin(3 * M)
+    
+    sun_lon = (L0 + C) % 360
+    return sun_lon
+
+# Amplitudes of the Moon's main periodic longitude terms, in degrees
+MOON_LON_COEFFS = (6.28875, 1.27402, 0.65892, 0.21908, 0.14753, 0.14120)
+
+# Moon's mean elongation (D) and mean anomaly (Mp) polynomials, pre-scaled to radians
+MOON_D_C0 = 297.8501921 * _DEG2RAD
+MOON_D_C1 = 445267.1114034 * _DEG2RAD
+MOON_D_C2 = -0.0018819 * _DEG2RAD
+MOON_D_C3 = _DEG2RAD / 545868
+MOON_D_C4 = -_DEG2RAD / 113065000
+MOON_MP_C0 = 134.9633964 * _DEG2RAD
+MOON_MP_C1 = 477198.8675055 * _DEG2RAD
+MOON_MP_C2 = 0.0087414 * _DEG2RAD
+MOON_MP_C3 = _DEG2RAD / 69699
+MOON_MP_C4 = -_DEG2RAD / 14712000
+
+def calculate_moon_position(jd):
+    """Calculate Moon's position (simplified)"""
+    T = (jd - 2451545.0) / 36525.0
+    
+    Lp = 218.3164477 + 481267.88123421 * T - 0.0015786 * T * T + T * T * T / 538841 - T * T * T * T / 65194000
+    D = MOON_D_C0 + MOON_D_C1 * T + MOON_D_C2 * T * T + MOON_D_C3 * T * T * T + MOON_D_C4 * T * T * T * T
+    Mp = MOON_MP_C0 + MOON_MP_C1 * T + MOON_MP_C2 * T * T + MOON_MP_C3 * T * T * T + MOON_MP_C4 * T * T * T * T
+    
+    # Unrolled scalar terms: an array here would be a heap allocation per call
+    moon_lon = (Lp + MOON_LON_COEFFS[0] * math.sin(Mp) + MOON_LON_COEFFS[1] * math.sin(2*D - Mp) +
+                MOON_LON_COEFFS[2] * math.sin(2*D) + MOON_LON_COEFFS[3] * math.sin(2*Mp) +
+                MOON_LON_COEFFS[4] * math.sin(D) + MOON_LON_COEFFS[5] * math.sin(Mp - D)) % 360
+    
+    return moon_lon
+
+def apply_ayanamsa(longitude, ayanamsa_value=23.638333):
+    """Apply Ayanamsa to convert Sayana to Nirayana"""
+    nirayana = (longitude - ayanamsa_value) % 360
+    return nirayana
+
+# Index kernels: compiled code cannot index the name lists, so these return
+# plain indices and app.py's get_* wrappers do the lookups.
+# Nakshatra padas (quarters) per degree: 27 nakshatras x 4 padas over 360 degrees
+PADAS_PER_DEGREE = 108.0 / 360.0
+# Yogas per degree of the Sun + Moon sum (27 over 360 degrees)
+YOGAS_PER_DEGREE = 27.0 / 360.0
+
+def nakshatra_index(moon_lon):
+    # Find the pada first so nakshatra and pada always agree
+    quarter = int(moon_lon * PADAS_PER_DEGREE)
+    if quarter > 107:
+        quarter = 107
+    return quarter // 4, quarter % 4 + 1
+
+def rasi_index(longitude):
+    rasi_index = int(longitude / 30)
+    return rasi_index if rasi_index < 11 else 11
+
+def tithi_index(sun_lon, moon_lon):
+    elongation = (moon_lon - sun_lon) % 360
+    # 0-14 is the waxing (Sukla) half, 15-29 the waning (Krishna) half
+    tithi_index = int(elongation / 12)
+    return tithi_index if tithi_index < 29 else 29
+
+def yoga_index(sun_lon, moon_lon):
+    yoga_sum = (sun_lon + moon_lon) % 360
+    yoga_index = int(yoga_sum * YOGAS_PER_DEGREE)
+    return yoga_index if yoga_index < 26 else 26
+
+# Numba signatures of every kernel, shared by the AoT and JIT builds
+SIGNATURES = {
+    "calculate_julian_day": "float64(int64, int64, int64, float64, int64, int64)",
+    "calculate_sun_position": "float64(float64)",
+    "calculate_moon_position": "float64(float64)",
+    "apply_ayanamsa": "float64(float64, float64)",
+    "nakshatra_index": "UniTuple(int64, 2)(float64)",
+    "rasi_index": "int64(float64)",
+    "tithi_index": "int64(float64, float64)",
+    "yoga_index": "int64(float64, float64)",
+}
+
+FASTMATH_KERNELS = {"calculate_sun_position", "calculate_moon_position"}
+
+def jit_kernels():
+    """JIT-compile every kernel with Numba (cached on disk)"""
+    from numba import njit
+    
+    return SimpleNamespace(**{
+        name: njit(signature, cache=True, fastmath=name in FASTMATH_KERNELS)(globals()[name])
+        for name, signature in SIGNATURES.items()
+    })
@@ -0,0 +1,23 @@
+"""Build the astro_kernels extension from astro_math ahead of time.
+
+Run once at deploy time (bin/post_compile does this on Heroku):
+
+    python compile_kernels.py
+
+app.py imports astro_kernels when the built module is present and falls
+back to JIT-compiling astro_math otherwise.
+"""
+import os
+
+from numba.pycc import CC
+
+import astro_math
+
+cc = CC('astro_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+for name, signature in astro_math.SIGNATURES.items():
+    cc.export(name, signature)(getattr(astro_math, name))
+
+if __name__ == '__main__':
+    cc.compile()
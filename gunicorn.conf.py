@@ -0,0 +1,13 @@
+import multiprocessing
+import os
+
+# Gunicorn configuration (used by the Procfile)
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# The chart endpoints are CPU-bound, so scale with plain sync workers
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'sync'
+
+# Import the app (and compile the Numba kernels) once in the master,
+# then share it with the forked workers copy-on-write
+preload_app = True